@@ -0,0 +1,149 @@
+"""
+Chassis Module
+=======================
+
+This module combines the drive motor and the steering servo into a single `Chassis` object
+backed by one shared `pigpio` connection, so a control tick updates both channels back-to-back
+over the same daemon socket instead of paying two independent Python-to-daemon round trips.
+
+Classes:
+--------
+- Chassis: A class to manage the drive motor and steering servo together.
+
+Example Usage:
+--------------
+To use this module, create an instance of `Chassis` and call its methods.
+
+    from chassis_module import Chassis
+
+    chassis = Chassis(25, 23, 24, 18)
+    chassis.apply(0.6, 0.1)
+
+Dependencies:
+-------------
+- pigpio: Ensure that the `pigpio` library is installed and the `pigpiod` daemon is running on your system.
+
+Note:
+-----
+This script is intended to run on a Raspberry Pi with connected DC motors and a servo motor.
+"""
+
+import pigpio
+
+class Chassis:
+    """
+    Class to control the drive motor and steering servo through one pigpio connection.
+    """
+    def __init__(self, ena1, in1, in2, servo_pin):
+        """
+        Initialize the motor and servo pins on a single pigpio connection.
+
+        Args:
+            ena1: GPIO pin for motor enable 1 (ENA1).
+            in1: GPIO pin for motor input 1 (IN1).
+            in2: GPIO pin for motor input 2 (IN2).
+            servo_pin: GPIO pin for the steering servo signal.
+        """
+        self.ena1 = ena1
+        self.in1 = in1
+        self.in2 = in2
+        self.servo_pin = servo_pin
+
+        self._pi = pigpio.pi()
+        self._pi.set_mode(self.in1, pigpio.OUTPUT)
+        self._pi.set_mode(self.in2, pigpio.OUTPUT)
+        self._pi.set_mode(self.servo_pin, pigpio.OUTPUT)
+
+        self._pi.set_PWM_frequency(self.ena1, 100)
+        self._pi.set_PWM_range(self.ena1, 1000000)
+        self._pi.set_PWM_dutycycle(self.ena1, 0)
+
+        # Bank masks for the direction pins: both inputs are updated through
+        # set_bank_1/clear_bank_1, which write all 32 gpios in one operation.
+        self._fwd_mask = 1 << in1
+        self._bwd_mask = 1 << in2
+
+        self._last_duty = None
+        self._last_dir = None
+        self._last_pulse = None
+
+    def _set_direction(self, direction):
+        """
+        Write both H-bridge input pins with batched bank operations.
+
+        The inactive pin is cleared first and the active pin set second, each
+        as one atomic 32-gpio bank write, so the bridge never sees both
+        inputs transiently high (shoot-through) and each update costs one
+        daemon command instead of two per pin.
+
+        Args:
+            direction: 1 for forward, -1 for backward.
+        """
+        if direction < 0:
+            self._pi.clear_bank_1(self._fwd_mask)
+            self._pi.set_bank_1(self._bwd_mask)
+        else:
+            self._pi.clear_bank_1(self._bwd_mask)
+            self._pi.set_bank_1(self._fwd_mask)
+
+    def move(self, speed=0.5):
+        """
+        Move the motor with the specified speed.
+
+        Args:
+            speed: Speed of motion, ranging from -1 (full backward) to 1 (full forward). Default is 0.5.
+        """
+        speed = -1.0 if speed < -1 else (1.0 if speed > 1 else speed)
+        duty_cycle = int(abs(speed) * 1000000)
+        direction = -1 if speed < 0 else 1
+        if duty_cycle == self._last_duty and direction == self._last_dir:
+            return
+        self._pi.set_PWM_dutycycle(self.ena1, duty_cycle)
+
+        if direction != self._last_dir:
+            self._set_direction(direction)
+        self._last_duty = duty_cycle
+        self._last_dir = direction
+
+    def set_angle(self, ratio):
+        """
+        Set the servo angle based on a ratio.
+
+        Args:
+            ratio: Ratio for the angle, ranging from -1 (minimum position) to 1 (maximum position).
+        """
+        ratio = -1.0 if ratio < -1 else (1.0 if ratio > 1 else ratio)
+        pulse_width = int(round(500 + (ratio + 1) * 1000))
+        if pulse_width == self._last_pulse:
+            return
+        self._pi.set_servo_pulsewidth(self.servo_pin, pulse_width)
+        self._last_pulse = pulse_width
+
+    def apply(self, speed, angle):
+        """
+        Apply a motor speed and steering angle in one call.
+
+        Both channel updates go out back-to-back on the shared pigpio
+        connection, so the per-tick cost is a single fused update instead of
+        two independent controller calls.
+
+        Args:
+            speed: Speed of motion, ranging from -1 to 1.
+            angle: Ratio for the steering angle, ranging from -1 to 1.
+        """
+        self.move(speed)
+        self.set_angle(angle)
+
+    def stop(self):
+        """Stop the motor."""
+        self._pi.set_PWM_dutycycle(self.ena1, 0)
+        self._pi.clear_bank_1(self._fwd_mask | self._bwd_mask)
+        self._last_duty = 0
+        self._last_dir = None
+
+    def release(self):
+        """Stop the motor, center and detach the servo, and release the GPIO resources."""
+        self.stop()
+        self.set_angle(0)
+        self._pi.set_servo_pulsewidth(self.servo_pin, 0)
+        self._pi.stop()
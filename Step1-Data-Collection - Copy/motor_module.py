@@ -2,7 +2,7 @@
 DC Motors Module
 =======================
 
-This module provides a simple interface to control a small car prototype with four DC motors using the `Rpi.GPIO` library.
+This module provides a simple interface to control a small car prototype with four DC motors using the `pigpio` library.
 
 Classes:
 --------
@@ -23,15 +23,19 @@ To test this module, you can run it directly as a script. It will perform a seri
 
 Dependencies:
 -------------
-- Rpi.GPIO: Ensure that the `Rpi.GPIO` library is installed and properly configured on your system.
+- pigpio: Ensure that the `pigpio` library is installed and the `pigpiod` daemon is running on your system.
 
 Note:
 -----
 This script is intended to run on a Raspberry Pi with connected DC motors.
 """
 
-import RPi.GPIO as GPIO
-from time import sleep
+import pigpio
+
+# Duty-cycle lookup for int8-quantized speeds: index by abs(quantized speed),
+# where quantized speed = round(speed * 127). Replaces the per-call
+# float-multiply with a table read.
+_DUTY_LUT = tuple(int(q * 1000000 // 127) for q in range(128))
 
 class MotorController:
     """
@@ -41,6 +45,10 @@ class MotorController:
         """
         Initialize the DC motor module with the specified GPIO pins.
 
+        PWM on the enable pin is generated by pigpio, which times the pulses
+        with DMA instead of a Python thread, so the duty cycle stays stable
+        regardless of interpreter load.
+
         Args:
             ena1: GPIO pin for motor enable 1 (ENA1).
             in1: GPIO pin for motor input 1 (IN1).
@@ -49,43 +57,98 @@ class MotorController:
         self.ena1 = ena1
         self.in1 = in1
         self.in2 = in2
-        
-        GPIO.setmode(GPIO.BCM)
-        GPIO.setup(self.ena1, GPIO.OUT)
-        GPIO.setup(self.in1, GPIO.OUT)
-        GPIO.setup(self.in2, GPIO.OUT)
-        
-        self.pwm = GPIO.PWM(self.ena1, 100)  # PWM at 100Hz
-        self.pwm.start(0)
+
+        self._pi = pigpio.pi()
+        self._pi.set_mode(self.in1, pigpio.OUTPUT)
+        self._pi.set_mode(self.in2, pigpio.OUTPUT)
+
+        self._pi.set_PWM_frequency(self.ena1, 100)
+        self._pi.set_PWM_range(self.ena1, 1000000)
+        self._pi.set_PWM_dutycycle(self.ena1, 0)
+
+        # Bank masks for the direction pins: both inputs are updated through
+        # set_bank_1/clear_bank_1, which write all 32 gpios in one operation.
+        self._fwd_mask = 1 << in1
+        self._bwd_mask = 1 << in2
+
+        self._last_duty = None
+        self._last_dir = None
+
+    def _set_direction(self, direction):
+        """
+        Write both H-bridge input pins with batched bank operations.
+
+        The inactive pin is cleared first and the active pin set second, each
+        as one atomic 32-gpio bank write, so the bridge never sees both
+        inputs transiently high (shoot-through) and each update costs one
+        daemon command instead of two per pin.
+
+        Args:
+            direction: 1 for forward, -1 for backward.
+        """
+        if direction < 0:
+            self._pi.clear_bank_1(self._fwd_mask)
+            self._pi.set_bank_1(self._bwd_mask)
+        else:
+            self._pi.clear_bank_1(self._bwd_mask)
+            self._pi.set_bank_1(self._fwd_mask)
 
     def move(self, speed=0.5):
         """
         Move the motor forward with the specified speed.
 
+        The last written duty cycle and direction are cached, so calling this
+        every control tick with an unchanged speed performs no GPIO work.
+
         Args:
             speed: Speed of motion, ranging from -1 (full backward) to 1 (full forward). Default is 0.5.
         """
-        speed = max(-1, min(1, speed))
-        duty_cycle = abs(speed) * 100
-        self.pwm.ChangeDutyCycle(duty_cycle)
-        
-        if speed < 0:
-            GPIO.output(self.in1, GPIO.LOW)
-            GPIO.output(self.in2, GPIO.HIGH)
-        else:
-            GPIO.output(self.in1, GPIO.HIGH)
-            GPIO.output(self.in2, GPIO.LOW)
+        speed = -1.0 if speed < -1 else (1.0 if speed > 1 else speed)
+        duty_cycle = int(abs(speed) * 1000000)
+        direction = -1 if speed < 0 else 1
+        if duty_cycle == self._last_duty and direction == self._last_dir:
+            return
+        self._pi.set_PWM_dutycycle(self.ena1, duty_cycle)
+
+        if direction != self._last_dir:
+            self._set_direction(direction)
+        self._last_duty = duty_cycle
+        self._last_dir = direction
+
+    def move_quantized(self, speed_q):
+        """
+        Move the motor using an int8-quantized speed.
+
+        Callers that already hold a quantized speed (round(speed * 127)) can
+        use this entry point: the duty cycle comes from a precomputed lookup
+        table, so no floating-point math runs per call.
+
+        Args:
+            speed_q: Quantized speed, ranging from -127 (full backward) to 127 (full forward).
+        """
+        speed_q = -127 if speed_q < -127 else (127 if speed_q > 127 else speed_q)
+        duty_cycle = _DUTY_LUT[-speed_q if speed_q < 0 else speed_q]
+        direction = -1 if speed_q < 0 else 1
+        if duty_cycle == self._last_duty and direction == self._last_dir:
+            return
+        self._pi.set_PWM_dutycycle(self.ena1, duty_cycle)
+
+        if direction != self._last_dir:
+            self._set_direction(direction)
+        self._last_duty = duty_cycle
+        self._last_dir = direction
 
     def stop(self):
         """Stop the motor."""
-        self.pwm.ChangeDutyCycle(0)
-        GPIO.output(self.in1, GPIO.LOW)
-        GPIO.output(self.in2, GPIO.LOW)
+        self._pi.set_PWM_dutycycle(self.ena1, 0)
+        self._pi.clear_bank_1(self._fwd_mask | self._bwd_mask)
+        self._last_duty = 0
+        self._last_dir = None
 
     def release(self):
         """Release the GPIO resources used by the motor."""
-        self.pwm.stop()
-        GPIO.cleanup()
+        self.stop()
+        self._pi.stop()
 
 def main():
     """
@@ -93,16 +156,19 @@ def main():
 
     This function creates an instance of `MotorController`, initializes the motors, and
     performs a series of movements to test the motor control functions.
-    
+
     This function is intended for testing purposes and should not be used
     when the module is imported elsewhere.
-    
+
     Args:
     None
-    
+
     Returns:
     None
     """
+    # Only the demo loop sleeps, so the import stays out of the module body.
+    from time import sleep
+
     print("Let's introduce our motors to our PI!")
     motor_controller = MotorController(25, 23, 24)
     print("Let's go!")
@@ -115,7 +181,7 @@ def main():
             motor_controller.stop()
             print("The car stopped moving!")
             sleep(2)
-            
+
             # Move Backward
             motor_controller.move(-1)
             print("The car is moving backward!")
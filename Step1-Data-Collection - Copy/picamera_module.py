@@ -1,23 +1,35 @@
 """
 PiCamera Module
-=======================
+===============
 
-This module provides a simple interface to capture images using the `picamera2` library on a Raspberry Pi.
+This module provides the single, canonical camera controller shared by the
+data-collection and implementation steps. Earlier revisions carried several
+near-identical controller classes that had to receive every fix in lockstep;
+they are collapsed into one parameterized `PiCameraController`, with a thin
+`CameraController` alias preserving the data-collection call convention.
 
 Classes:
 --------
-- CameraController: A class to manage the initialization and capturing of images with the PiCamera.
+- PiCameraController: The parameterized camera controller (picamera2 backend).
+- CameraController: Alias for the Step1 scripts; starts mirrored at construction.
 
 Example Usage:
 --------------
-To use this module, create an instance of `CameraController` and call its methods.
+To use this module, create an instance of `PiCameraController` and call its methods.
+
+    from picamera_module import PiCameraController
+
+    with PiCameraController() as camera_controller:
+        camera_controller.get_img("example_image")
+
+The Step1 data-collection convention is also supported:
 
     from picamera_module import CameraController
 
     camera_controller = CameraController()
-    camera_controller.get_img('image.jpg')
+    camera_controller.get_img('image', roi=(0.0, 0.2, 0.8, 0.8))
 
-To test this module, you can run it directly as a script. It will capture an image and save it as 'test_image.jpg'.
+To test this module, you can run it directly as a script. It will initialize the camera and capture 10 images named 'test_0.jpg' to 'test_9.jpg'.
 
     $ python3 picamera_module.py
 
@@ -31,72 +43,521 @@ This script is intended to run on a Raspberry Pi with a connected camera module.
 """
 
 from picamera2 import Picamera2
+from picamera2.encoders import H264Encoder
+from picamera2.outputs import FfmpegOutput
+from libcamera import Transform
 import cv2
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-class CameraController:
-    """
-    Class to control the PiCamera module.
-    """
-    def __init__(self):
+class PiCameraController:
+
+    # JPEG quality for saved images. 85 is visually indistinguishable from
+    # the encoder defaults (93/95) at roughly half the file size, which
+    # halves SD-card write bandwidth in the capture loop. Raise it if a
+    # downstream consumer ever needs higher-fidelity images.
+    jpeg_quality = 85
+
+    def __init__(self, resolution=None, hflip=False, vflip=False, roi=None, warmup_poll=True,
+                 video_size=None):
         """
-        Initialize the PiCamera module.
+        Initialize the PiCameraController class.
+
+        The constructor only records the configuration; the camera itself is
+        opened by `pi_cam_init` (or by entering a with-block), so controllers
+        can be built cheaply and initialized exactly once.
+
+        Args:
+        resolution (tuple, optional): Main stream size as (width, height). Default is the sensor's native still size.
+        hflip (bool): Mirror the image horizontally. Default is False.
+        vflip (bool): Mirror the image vertically. Default is False.
+        roi (tuple, optional): Default region of interest applied at init, as (x, y, width, height) ratios.
+        warmup_poll (bool): Poll auto-exposure convergence at init instead of sleeping. Default is True.
+        video_size (tuple, optional): Switch to a continuous video configuration with this
+                                      (width, height) main stream. The ISP scaler does the
+                                      downscale in hardware, so a stream sized near the model
+                                      input cuts DMA bandwidth and leaves nothing to resize in
+                                      Python. Default is the full-resolution still configuration.
         """
-        self.picam2 = Picamera2()
-        self.picam2.configure(self.picam2.create_still_configuration())
-        self.picam2.start()
+        self.resolution = resolution
+        self.hflip = hflip
+        self.vflip = vflip
+        self.roi = roi
+        self.warmup_poll = warmup_poll
+        self.video_size = video_size
+        self.pi_cam = None
+        self._frame = None
+        self._frame_id = 0
+        self._frame_lock = threading.Lock()
+        self._capture_thread = None
+        self._running = False
+        self.staging_dir = "/dev/shm/picam"
+        self._flush_executor = None
+        self._staging_slots = None
+        self._staging_seq = 0
+        # Single worker that runs saves off the caller's thread, so the
+        # control loop can overlap encode/write with its own work.
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._encode_params = (cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality,
+                               cv2.IMWRITE_JPEG_OPTIMIZE, 1)
+        self._roi_key = None
+        self._roi_slices = None
 
-    def get_img(self, file_path='image', roi=None):
+    def pi_cam_init(self, roi=None, hflip=None, vflip=None):
         """
-        Capture an image and save it to the specified file path.
+        Initialize and start the PiCamera.
+
+        This method sets up the `pi_cam` attribute, configures the camera, and starts it.
+        Any flip is applied by the ISP through a libcamera Transform at configuration
+        time, so no post-capture pixel work is ever needed.
+
+        Calling it again on an initialized controller is cheap and idempotent: the
+        camera, its buffers, and the warm-up are reused and only the ROI control is
+        reapplied, instead of a ~2 s teardown/reconfigure cycle.
 
         Args:
-            file_path: Path to save the captured image. Default is 'image.jpg'.
+        roi (tuple, optional): A tuple defining the region of interest (ROI) as (x, y, width, height).
+                               Each value should be a proportion of the total image dimensions (0.0 to 1.0).
+        hflip (bool, optional): Mirror the image horizontally; defaults to the constructor value.
+        vflip (bool, optional): Mirror the image vertically; defaults to the constructor value.
+
+        Returns:
+        None
         """
-        img_name = f"{file_path}.jpg"
-        self.picam2.capture_file(img_name)
-        img = cv2.imread(img_name)
-        img = cv2.flip(img, -1)
+        if self.pi_cam is None:
+            if hflip is not None:
+                self.hflip = hflip
+            if vflip is not None:
+                self.vflip = vflip
+            self.pi_cam = Picamera2()
+            transform = Transform(hflip=self.hflip, vflip=self.vflip)
+            if self.video_size is not None:
+                # Hardware-scaled low-res stream for continuous consumers
+                # (e.g. inference); buffer_count=4 keeps the pipeline fed.
+                config = self.pi_cam.create_video_configuration(
+                    main={"size": self.video_size, "format": "RGB888"},
+                    buffer_count=4, transform=transform)
+            elif self.resolution is not None:
+                config = self.pi_cam.create_still_configuration(main={"size": self.resolution}, transform=transform)
+            else:
+                config = self.pi_cam.create_still_configuration(transform=transform)
+            self.pi_cam.configure(config)
+            self.pi_cam.options["quality"] = self.jpeg_quality
+            self.pi_cam.start()
+
+            # Wait for auto-exposure to converge instead of sleeping a fixed 2 s
+            if self.warmup_poll:
+                self._wait_for_ae()
+
+            # Continuously refresh the most-recent frame in the background so
+            # consumers never block on capture latency.
+            self._running = True
+            self._capture_thread = threading.Thread(target=self._update, daemon=True)
+            self._capture_thread.start()
+
+            self._init_staging()
+
         if roi:
-            x, y, w, h = roi
-            height, width, _ = img.shape
+            self.set_roi(roi)
+        elif self.roi:
+            self.set_roi(self.roi)
+
+    def _wait_for_ae(self, max_polls=40, interval=0.05):
+        """
+        Wait until auto-exposure reports convergence, then lock it.
+
+        Polls the capture metadata for AeLocked instead of sleeping a fixed
+        2 seconds; on a bright scene this returns in 200-400 ms. Once
+        converged, the exposure time and gain are frozen so subsequent
+        captures are deterministic and never wait on the AE loop.
+
+        Args:
+        max_polls (int): Maximum number of metadata polls before giving up.
+        interval (float): Delay between polls in seconds.
+
+        Returns:
+        None
+        """
+        metadata = {}
+        for _ in range(max_polls):
+            metadata = self.pi_cam.capture_metadata()
+            if metadata.get('AeLocked', False):
+                break
+            time.sleep(interval)
+        if 'ExposureTime' in metadata and 'AnalogueGain' in metadata:
+            self.pi_cam.set_controls({
+                "AeEnable": False,
+                "AwbEnable": False,
+                "ExposureTime": metadata['ExposureTime'],
+                "AnalogueGain": metadata['AnalogueGain'],
+            })
+
+    def _init_staging(self):
+        """
+        Prepare the tmpfs staging area and its background flush worker.
+
+        JPEGs are first written to `/dev/shm` (tmpfs, memcpy-speed) and moved
+        to their final SD-card location by a single background thread, so the
+        capture path never waits on SD-card write latency. A bounded slot
+        count caps how many files may sit in RAM at once. If tmpfs is not
+        available the controller silently falls back to direct writes.
+
+        Args:
+        None
+
+        Returns:
+        None
+        """
+        try:
+            os.makedirs(self.staging_dir, exist_ok=True)
+        except OSError:
+            self.staging_dir = None
+            return
+        self._flush_executor = ThreadPoolExecutor(max_workers=1)
+        self._staging_slots = threading.BoundedSemaphore(16)
+
+    def _write_jpg(self, file_path, payload):
+        """
+        Write encoded JPEG bytes, staging through tmpfs when possible.
+
+        If a staging slot is free the payload goes to tmpfs and the background
+        worker moves it to `file_path`; when staging is unavailable or full
+        the bytes are written straight to the final path instead of blocking.
+
+        Args:
+        file_path (str): Final destination path, including extension.
+        payload (bytes): Encoded JPEG data.
+
+        Returns:
+        None
+        """
+        if self._flush_executor is not None and self._staging_slots.acquire(blocking=False):
+            self._staging_seq += 1
+            staging_path = os.path.join(self.staging_dir, f"{self._staging_seq}_{os.path.basename(file_path)}")
+            Path(staging_path).write_bytes(payload)
+            self._flush_executor.submit(self._flush_one, staging_path, file_path)
+            return
+        Path(file_path).write_bytes(payload)
+
+    def _flush_one(self, staging_path, final_path):
+        """
+        Background worker task: move one staged file to its final location.
+
+        Args:
+        staging_path (str): Path of the staged file in tmpfs.
+        final_path (str): Final destination path.
+
+        Returns:
+        None
+        """
+        try:
+            shutil.move(staging_path, final_path)
+        finally:
+            self._staging_slots.release()
+
+    def _update(self):
+        """
+        Background worker: keep capturing into the single most-recent-frame slot.
+
+        The newest frame always overwrites the previous one (leaky single-slot
+        buffer), so readers get the latest image at the cost of a pointer swap.
+
+        Args:
+        None
+
+        Returns:
+        None
+        """
+        while self._running:
+            frame = self.pi_cam.capture_array("main")
+            with self._frame_lock:
+                self._frame = frame
+                self._frame_id += 1
+
+    def get_frame(self):
+        """
+        Return the most recently captured frame as a numpy array.
+
+        Blocks only until the very first frame has arrived after init;
+        afterwards it is a lock-guarded pointer read.
+
+        Args:
+        None
+
+        Returns:
+        numpy.ndarray: The latest captured frame.
+        """
+        while True:
+            with self._frame_lock:
+                frame = self._frame
+            if frame is not None:
+                return frame
+            time.sleep(0.01)
+
+    def get_latest(self, previous_id=None):
+        """
+        Return the newest frame together with its sequence number.
+
+        Passing the previously returned id makes the call block until the
+        background thread has produced a genuinely newer frame, so a consumer
+        that runs faster than the camera never re-processes a stale frame,
+        while a slower consumer always skips straight to the latest one.
+
+        Args:
+        previous_id (int, optional): Sequence number from the last call; None returns immediately.
+
+        Returns:
+        tuple: (numpy.ndarray frame, int frame_id).
+        """
+        while True:
+            with self._frame_lock:
+                frame = self._frame
+                frame_id = self._frame_id
+            if frame is not None and frame_id != previous_id:
+                return frame, frame_id
+            time.sleep(0.001)
+
+    def set_roi(self, roi):
+        """
+        Set the region of interest (ROI) for the camera.
+
+        Args:
+        roi (tuple): A tuple defining the region of interest (ROI) as (x, y, width, height).
+
+        Returns:
+        None
+        """
+        # Get the current configuration's size
+        width, height = self.pi_cam.sensor_resolution
+        x = int(roi[0] * width)
+        y = int(roi[1] * height)
+        roi_width = int(roi[2] * width)
+        roi_height = int(roi[3] * height)
+
+        # Set the ROI using the calculated absolute pixel values
+        self.pi_cam.set_controls({"ScalerCrop": (x, y, roi_width, roi_height)})
+
+    def _crop(self, img, roi):
+        """
+        Crop a frame to a ratio ROI as a numpy view, without copying pixels.
+
+        The ROI ratios and frame size are constant during a run, so the pixel
+        slices are computed once and reused every frame.
+
+        Args:
+        img (numpy.ndarray): Frame to crop.
+        roi (tuple): (x, y, width, height) crop, each as a ratio of the frame size.
+
+        Returns:
+        numpy.ndarray: A view of the cropped region.
+        """
+        height, width = img.shape[:2]
+        roi_key = (roi, height, width)
+        if roi_key != self._roi_key:
             x_norm, y_norm, w_norm, h_norm = roi
             x = int(x_norm * width)
             y = int(y_norm * height)
             w = int(w_norm * width)
             h = int(h_norm * height)
-            img = img[y:y+h, x:x+w]
-        cv2.imwrite(img_name, img)
-        print(f"Image captured and saved to {file_path}")
+            self._roi_slices = (slice(y, y + h), slice(x, x + w))
+            self._roi_key = roi_key
+        return img[self._roi_slices]
+
+    def capture_burst(self, file_names):
+        """
+        Capture and save a sequence of images through a two-slot ping-pong pipeline.
+
+        A producer thread captures frame i+1 into one buffer slot while the
+        caller JPEG-encodes and writes frame i from the other slot, with a
+        filled/free event pair per slot for synchronization. Throughput becomes
+        max(capture time, encode time) instead of their sum.
+
+        Args:
+        file_names (list): Names to save the image files as, without file extension.
+
+        Returns:
+        None
+        """
+        buffers = [None, None]
+        slot_filled = (threading.Event(), threading.Event())
+        slot_free = (threading.Event(), threading.Event())
+        for event in slot_free:
+            event.set()
+
+        def _producer():
+            for i in range(len(file_names)):
+                slot = i & 1
+                slot_free[slot].wait()
+                slot_free[slot].clear()
+                buffers[slot] = self.pi_cam.capture_array("main")
+                slot_filled[slot].set()
+
+        producer = threading.Thread(target=_producer, daemon=True)
+        producer.start()
+        for i, file_name in enumerate(file_names):
+            slot = i & 1
+            slot_filled[slot].wait()
+            slot_filled[slot].clear()
+            ok, encoded = cv2.imencode('.jpg', buffers[slot], self._encode_params)
+            slot_free[slot].set()
+            self._write_jpg(f"{file_name}.jpg", encoded.tobytes())
+        producer.join()
+
+    def record_video(self, file_name, duration, bitrate=10_000_000):
+        """
+        Record H.264 video through the Pi's hardware V4L2 M2M encoder.
+
+        H264Encoder hands frames to the hardware encoder, so the CPU cost of
+        recording is close to zero and real-time framerates hold even while
+        the rest of the pipeline keeps running; FfmpegOutput muxes the
+        elementary stream into the container named by the file extension.
+
+        Args:
+        file_name (str): The name to save the video file as, without file extension.
+        duration (float): Recording length in seconds.
+        bitrate (int): Target encoder bitrate in bits per second. Default is 10 Mb/s.
+
+        Returns:
+        None
+        """
+        assert self.pi_cam is not None, "pi_cam_init() must be called once before record_video()"
+        encoder = H264Encoder(bitrate=bitrate)
+        self.pi_cam.start_recording(encoder, FfmpegOutput(f"{file_name}.mp4"))
+        time.sleep(duration)
+        self.pi_cam.stop_recording()
+
+    def get_img(self, file_name, roi=None, save=True):
+        """
+        Return the most recent frame, saving it under the provided file name.
+
+        The frame comes from the background capture thread, so this call only
+        pays for the JPEG encode and write, not for a full capture. An
+        optional ratio ROI is applied as a cached numpy view before encoding,
+        which is the convention the data-collection scripts rely on. Callers
+        that only need the pixels (e.g. the autonomous control loop) can pass
+        save=False to skip the encode and disk write entirely and consume the
+        returned array directly.
+
+        Args:
+        file_name (str): The name to save the image file as, without file extension.
+        roi (tuple, optional): (x, y, width, height) crop, each as a ratio of the frame size.
+        save (bool): Persist the frame as a JPEG. Default is True.
+
+        Returns:
+        numpy.ndarray: The (optionally cropped) frame.
+        """
+        assert self.pi_cam is not None, "pi_cam_init() must be called once before get_img()"
+        img = self.get_frame()
+        if roi:
+            img = self._crop(img, roi)
+        if save:
+            ok, encoded = cv2.imencode('.jpg', img, self._encode_params)
+            self._write_jpg(f"{file_name}.jpg", encoded.tobytes())
+        return img
+
+    def get_img_async(self, file_name, roi=None):
+        """
+        Save the most recent frame without blocking the caller.
+
+        The encode and write run on a single worker thread; the caller gets a
+        Future and can overlap its own work (e.g. the motor control loop)
+        with the save, collecting the result with `.result(timeout=...)`
+        only when it actually needs completion.
+
+        Args:
+        file_name (str): The name to save the image file as, without file extension.
+        roi (tuple, optional): (x, y, width, height) crop, each as a ratio of the frame size.
+
+        Returns:
+        concurrent.futures.Future: Resolves when the image has been saved.
+        """
+        return self._pool.submit(self.get_img, file_name, roi)
+
+    def close(self):
+        """
+        Stop the worker threads and release the camera resources.
+
+        Safe to call more than once: leaked Picamera2 instances keep their
+        CMA buffers, which slows down or breaks later camera inits, so the
+        guard makes double-close in cleanup paths harmless.
+
+        Args:
+        None
+
+        Returns:
+        None
+        """
+        self._running = False
+        if self._capture_thread is not None:
+            self._capture_thread.join(timeout=1)
+            self._capture_thread = None
+        if self._flush_executor is not None:
+            self._flush_executor.shutdown(wait=True)
+            self._flush_executor = None
+        self._pool.shutdown(wait=True)
+        if self.pi_cam is not None:
+            self.pi_cam.stop()
+            self.pi_cam.close()
+            self.pi_cam = None
 
     def release(self):
-        """Release the PiCamera resources."""
-        self.picam2.stop()
-        self.picam2.close()
+        """Alias for close(), kept for the data-collection call sites."""
+        self.close()
+
+    def __enter__(self):
+        """Enter a with-block: initialize the camera and return the controller."""
+        self.pi_cam_init()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the camera on with-block exit, even on error."""
+        self.close()
+        return False
+
+class CameraController(PiCameraController):
+    """
+    Data-collection alias of the canonical controller.
+
+    The Step1 scripts expect a camera that is mirrored both ways (the module
+    is mounted upside down on the car) and ready to capture straight after
+    construction, so this subclass flips by default and initializes eagerly.
+    """
+    def __init__(self, hflip=True, vflip=True):
+        """
+        Initialize and start the mirrored camera.
+
+        Args:
+            hflip: Mirror the image horizontally. Default is True.
+            vflip: Mirror the image vertically. Default is True.
+        """
+        super().__init__(hflip=hflip, vflip=vflip)
+        self.pi_cam_init()
 
 def main():
     """
     Main function for module testing.
 
-    This function creates an instance of `CameraController`, captures an image,
-    and saves it as 'test_image.jpg' to test the camera control functions.
-    
+    This function creates an instance of `PiCameraController`, initializes the camera, and
+    then captures 10 images sequentially, saving them as 'test_0.jpg' to 'test_9.jpg',
+    plus one ROI-cropped image to exercise the data-collection convention.
+
     This function is intended for testing purposes and should not be used
     when the module is imported elsewhere.
-    
+
     Args:
     None
-    
+
     Returns:
     None
     """
-    print("Initializing the camera...")
-    camera_controller = CameraController()
-    print("Capturing image...")
-    camera_controller.get_img('test_image0')
-    roi0 = (0.0, 0.2, 0.8, 0.8)
-    camera_controller.get_img('test_image1', roi=roi0)
-    camera_controller.release()
-    print("Image captured and saved as 'test_image.jpg'.")
+    roi = (0.0, 0.2, 0.8, 0.8)
+    with PiCameraController() as camera_controller:
+        camera_controller.capture_burst([f"test_{count}" for count in range(10)])
+        camera_controller.get_img('test_roi', roi=roi)
 
 if __name__ == '__main__':
     main()
@@ -2,7 +2,7 @@
 Steering Servo Module
 ======================
 
-This module provides a simple interface to control a steering servo motor using the `Rpi.GPIO` library.
+This module provides a simple interface to control a steering servo motor using the `pigpio` library.
 
 Classes:
 --------
@@ -23,15 +23,15 @@ To test this module, you can run it directly as a script. It will perform a seri
 
 Dependencies:
 -------------
-- Rpi.GPIO: Ensure that the `Rpi.GPIO` library is installed and properly configured on your system.
+- pigpio: Ensure that the `pigpio` library is installed and the `pigpiod` daemon is running on your system.
 
 Note:
 -----
 This script is intended to run on a Raspberry Pi with a connected servo motor.
 """
 
-import RPi.GPIO as GPIO
-from time import sleep
+import pigpio
+from time import monotonic, sleep
 
 class SteeringController:
     """
@@ -41,32 +41,40 @@ class SteeringController:
         """
         Initialize the servo motor with the specified GPIO pin.
 
+        Servo pulses are generated by pigpio's DMA-timed servo output, so
+        pulse widths stay accurate without a software PWM thread.
+
         Args:
             pin: GPIO pin for the servo signal. Default is 17.
         """
         self.pin = pin
-        GPIO.setmode(GPIO.BCM)
-        GPIO.setup(self.pin, GPIO.OUT)
-        
-        self.servo = GPIO.PWM(self.pin, 50)  # 50Hz frequency
-        self.servo.start(0)
+        self._pi = pigpio.pi()
+        self._pi.set_mode(self.pin, pigpio.OUTPUT)
+        self._last_pulse = None
 
     def set_angle(self, ratio):
         """
         Set the servo angle based on a ratio.
 
+        The pulse width is rounded to whole microseconds and cached, so
+        repeated calls with the same (or float-noise-close) ratio skip the
+        GPIO write entirely.
+
         Args:
             ratio: Ratio for the angle, ranging from -1 (minimum position) to 1 (maximum position).
         """
-        ratio = max(-1, min(1, ratio))
-        # Convert the ratio to a duty cycle (2% to 12% for -90 to 90 degrees)
-        duty_cycle = 2 + (ratio + 1) * 5
-        self.servo.ChangeDutyCycle(duty_cycle)
+        ratio = -1.0 if ratio < -1 else (1.0 if ratio > 1 else ratio)
+        # Convert the ratio to a pulse width (500 us to 2500 us for -90 to 90 degrees)
+        pulse_width = int(round(500 + (ratio + 1) * 1000))
+        if pulse_width == self._last_pulse:
+            return
+        self._pi.set_servo_pulsewidth(self.pin, pulse_width)
+        self._last_pulse = pulse_width
 
     def detach(self):
         """Release the GPIO resources used by the servo."""
-        self.servo.stop()
-        GPIO.cleanup()
+        self._pi.set_servo_pulsewidth(self.pin, 0)
+        self._pi.stop()
 
 def main():
     """
@@ -87,24 +95,36 @@ def main():
     print("Let's introduce our steering servo motor to our PI!")
     steering_controller = SteeringController(17)
     right_steering_error_handling = 0
+    # Deadline-based pacing: each step's deadline advances by a fixed period
+    # from the previous one, so the sweep cadence cannot drift the way
+    # back-to-back sleep(2) calls do under CPU load.
+    next_t = monotonic()
+
+    def pace(period=2.0):
+        nonlocal next_t
+        next_t += period
+        delay = next_t - monotonic()
+        if delay > 0:
+            sleep(delay)
+
     print("Let's go!")
     try:
         while True:
             # Set angle to maximum (1.0)
             print("Setting angle to maximum (0.5)")
             steering_controller.set_angle(0.5)
-            sleep(2)
+            pace()
 
             # Set angle to middle (0.0)
             print("Setting angle to middle (0.0)")
             steering_controller.set_angle(0.0)
-            sleep(2)
+            pace()
 
             # Set angle to minimum (-1.0)
             print("Setting angle to minimum (-0.5)")
             steering_controller.set_angle(-0.5)
             right_steering_error_handling = 1
-            sleep(2)
+            pace()
             
             # Set angle to middle (0.0)
             print("Setting angle to middle (0.0)")
@@ -112,7 +132,7 @@ def main():
                 steering_controller.set_angle(0.5)
                 right_steering_error_handling = 0
             steering_controller.set_angle(0.0)
-            sleep(2)
+            pace()
 
             # Sweep back and forth
             print("Sweeping back and forth")
@@ -124,7 +144,7 @@ def main():
                 if ratio < 0:
                     right_steering_error_handling = 1
                 steering_controller.set_angle(ratio)
-                sleep(2)
+                pace()
             
     except KeyboardInterrupt:
         steering_controller.detach()
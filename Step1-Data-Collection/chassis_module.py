@@ -0,0 +1,89 @@
+"""
+Chassis Module
+=======================
+
+This module combines the drive motor and the steering servo into a single `Chassis` object,
+so the control loop applies a motor speed and a steering angle with one fused call per tick
+instead of talking to two independent controller objects.
+
+Classes:
+--------
+- Chassis: A class to manage the drive motor and steering servo together.
+
+Example Usage:
+--------------
+To use this module, create an instance of `Chassis` and call its methods.
+
+    from chassis_module import Chassis
+
+    chassis = Chassis(25, 23, 24, 18)
+    chassis.apply(0.6, 0.1)
+
+Dependencies:
+-------------
+- gpiozero: Ensure that the `gpiozero` library is installed and properly configured on your system.
+
+Note:
+-----
+This script is intended to run on a Raspberry Pi with connected DC motors and a servo motor.
+"""
+
+from motor_module    import MotorController
+from steering_module import SteeringController
+
+class Chassis:
+    """
+    Class to control the drive motor and steering servo as one unit.
+    """
+    def __init__(self, ena1, in1, in2, servo_pin):
+        """
+        Initialize the motor and servo controllers.
+
+        Args:
+            ena1: GPIO pin for motor enable 1 (ENA1).
+            in1: GPIO pin for motor input 1 (IN1).
+            in2: GPIO pin for motor input 2 (IN2).
+            servo_pin: GPIO pin for the steering servo signal.
+        """
+        self._motor = MotorController(ena1, in1, in2)
+        self._steering = SteeringController(servo_pin)
+
+    def move(self, speed=0.5):
+        """
+        Move the motor with the specified speed.
+
+        Args:
+            speed: Speed of motion, ranging from -1 (full backward) to 1 (full forward). Default is 0.5.
+        """
+        self._motor.move(speed)
+
+    def set_angle(self, ratio):
+        """
+        Set the servo angle based on a ratio.
+
+        Args:
+            ratio: Ratio for the angle, ranging from -1 (minimum position) to 1 (maximum position).
+        """
+        self._steering.set_angle(ratio)
+
+    def apply(self, speed, angle):
+        """
+        Apply a motor speed and steering angle in one call.
+
+        Args:
+            speed: Speed of motion, ranging from -1 to 1.
+            angle: Ratio for the steering angle, ranging from -1 to 1.
+        """
+        self._motor.move(speed)
+        self._steering.set_angle(angle)
+
+    def stop(self):
+        """Stop the motor."""
+        self._motor.stop()
+
+    def release(self):
+        """Stop the motor, center and detach the servo, and release the GPIO resources."""
+        self._motor.stop()
+        self._motor.release()
+        self._steering.set_angle(0)
+        self._steering.detach()
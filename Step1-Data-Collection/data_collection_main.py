@@ -13,24 +13,19 @@ Modules:
 --------
 - data_collection_module    : Handles data collection and saving.
 - key_press_module          : Manages key press detection and control.
-- motor_module              : Control car movement.
-- steering_module           : Control car steering.
+- chassis_module            : Control car movement and steering through one fused object.
 - picamera_module           : Interfaces with the Raspberry Pi Camera for image capture.
 
-Global Variables:
------------------
-- done      : Flag variable to terminate the program.
-- record    : Flag variable to control recording status.
-- key_val   : Current pressed key.
-- key_old   : Last pressed key
-- speed     : Speed
-- angle     : Steering angle
+Classes:
+--------
+- State : Dataclass holding the mutable control state (done, record, key_val, key_old, speed, angle),
+          passed between the functions instead of module globals.
 
 Functions:
 ----------
-- get_key_press()               : Get key press status and update global variables.
-- update_movement_controls()    : Update speed and angle based on key presses.
-- main()                        : Main function to control the car's movement, handle key presses, and manage data recording.
+- get_key_press(state)              : Get key press status and update the control state.
+- update_movement_controls(state)   : Update speed and angle based on key presses.
+- main()                            : Main function to control the car's movement, handle key presses, and manage data recording.
 
 
 Key Presses:
@@ -53,8 +48,7 @@ Dependencies:
 -------------
 - data_collection_module    : Ensure that the `data_collection_module` module is properly implemented and available.
 - key_press_module          : Ensure that the `key_press_module` module is properly implemented and available.
-- motor_module              : Ensure that the `motor_module` module is properly implemented and available.
-- steering_module           : Ensure that the `steering_module` module is properly implemented and available.
+- chassis_module            : Ensure that the `chassis_module` module is properly implemented and available.
 - picamera_module           : Ensure that the `picamera_module` module is properly implemented and available.
 
 Note:
@@ -63,97 +57,197 @@ This script is designed to control an autonomous car system and requires proper
 """
 
 # Importing necessary modules
-import os
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional: without it the numeric helpers run as plain Python.
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
 from data_collection_module import DataCollector
 from key_press_module       import KeyPressController
-from motor_module           import MotorController
-from steering_module        import SteeringController
+from chassis_module         import Chassis
 from picamera_module        import CameraController
 
 # Constants
-KEY_LIST = ["RIGHT", "LEFT", "UP", "DOWN", "r", "s", "k"]
+KEY_LIST = ("RIGHT", "LEFT", "UP", "DOWN", "r", "s", "k")
 DEFAULT_SPEED = 1
 DEFAULT_ANGLE = 0.7
 ROI = (0.0, 0.2, 0.8, 0.8) # Ratio of interest
+LOOP_RATE = 50          # Main loop frequency in Hz
+CAMERA_TICK_DIVIDER = 2 # Collect data every N loop ticks (camera capture dominates wall time)
+
+# Movement dispatch table: key -> (speed, angle). A speed of None keeps the current speed.
+KEY_ACTIONS = {
+    "RIGHT": (None, DEFAULT_ANGLE),
+    "LEFT":  (None, -0.5),
+    "UP":    (DEFAULT_SPEED, -0.1),
+    "DOWN":  (-DEFAULT_SPEED, -0.1),
+    "s":     (0, 0),
+}
 
-# Global Variables
-done    = 0     # Flag variable to terminate the program
-record  = 0     # Flag variable to control recording status
-key_val = None  # Current pressed key
-key_old = None  # Last pressed key
-speed   = 0     # Initial speed
-angle   = 0     # Initial steering angle
-right_steering_error_handling = 0
+class RecordState(IntEnum):
+    """Recording state machine: advanced by the 'r' key and the per-state handlers."""
+    IDLE     = 0
+    STARTING = 1
+    RUNNING  = 2
+    STOPPING = 3
+
+@dataclass
+class State:
+    """
+    Mutable control state for one run of the program.
+
+    Kept in a single dataclass instance passed by reference, so the per-tick
+    functions read and write fast local attributes instead of module globals.
+    """
+    done: int = 0       # Flag variable to terminate the program
+    record: int = 0     # Flag variable to control recording status
+    key_val: str = None # Current pressed key
+    key_old: str = None # Last pressed key
+    speed: float = 0    # Initial speed
+    angle: float = 0    # Initial steering angle
+    right_steering_error_handling: int = 0
+    session_path: str = None # Image folder of the active recording session
 
 # Initializing modules
 data_collector = DataCollector()
 data_collector.data_collection_init()
 
 key_controller = KeyPressController()
-key_controller.key_press_init()
+key_controller.key_press_init(KEY_LIST)
 
-motor_controller = MotorController(25, 23, 24)
-
-steering_controller = SteeringController(18)
+chassis = Chassis(25, 23, 24, 18)
 
 camera_controller = CameraController()
 
-def get_key_press():
+@njit(cache=True)
+def _steering_correction(angle, err_flag):
     """
-    Get key press status and update global variables.
-    
-    This function checks the status of each key in the KEY_LIST and updates the key_val accordingly.
-    
+    Pure-numeric per-tick steering helper.
+
+    Computes whether the right-steering correction pulse must be applied before
+    the regular angle write, and the new error-handling flag. Kept free of any
+    object types so it can be compiled to native code by numba when available.
+
     Args:
-        None
-    
+        angle (float): Steering angle commanded for this tick.
+        err_flag (int): Current right-steering error-handling flag.
+
+    Returns:
+        tuple: (apply_correction, correction_angle, new_err_flag)
+    """
+    apply_correction = 0
+    if err_flag == 1 and angle == 0:
+        apply_correction = 1
+        err_flag = 0
+    if angle < 0:
+        err_flag = 1
+    return apply_correction, DEFAULT_ANGLE, err_flag
+
+def get_key_press(state):
+    """
+    Get key press status and update the control state.
+
+    This function polls the keyboard once, then checks the status of each key in the KEY_LIST and updates state.key_val accordingly.
+
+    Args:
+        state (State): Current control state.
+
     Returns:
         None
     """
-    global key_val
+    key_controller.poll()
     for key in KEY_LIST:
         if key_controller.get_key_status(key):
-            key_val = key
+            state.key_val = key
             break
 
-def update_movement_controls():
+def update_movement_controls(state):
     """
     Update speed and angle based on key presses.
-    
-    This function updates the speed and angle variables based on the current pressed key.
-    
+
+    This function looks the current pressed key up in the KEY_ACTIONS dispatch table and
+    updates the speed and angle in the control state; the record and terminate keys are
+    handled separately since they change state rather than movement.
+
     Args:
+        state (State): Current control state.
+
+    Returns:
         None
-    
+    """
+    action = KEY_ACTIONS.get(state.key_val)
+    if action is not None:
+        new_speed, new_angle = action
+        if new_speed is not None:
+            state.speed = new_speed
+        state.angle = new_angle
+    elif state.key_val == "k":
+        state.done += 1
+    elif state.key_val == "r" and state.key_val != state.key_old:
+        state.key_old = state.key_val
+        state.record += 1
+    if state.key_val != "r":
+        state.key_val = None
+        state.key_old = None
+
+def _record_starting(state, tick):
+    """
+    Handler for RecordState.STARTING: create the session folder and open the log.
+
+    Args:
+        state (State): Current control state.
+        tick (int): Current loop tick.
+
+    Returns:
+        None
+    """
+    print("Recording Started ...")
+    state.session_path = data_collector.data_directory / f"img{data_collector.folder_index}"
+    state.session_path.mkdir(exist_ok=True)
+    data_collector.open_log()
+    state.record = RecordState.RUNNING
+    _record_running(state, tick)
+
+def _record_running(state, tick):
+    """
+    Handler for RecordState.RUNNING: collect a sample on camera ticks.
+
+    Args:
+        state (State): Current control state.
+        tick (int): Current loop tick.
+
+    Returns:
+        None
+    """
+    if tick % CAMERA_TICK_DIVIDER == 0:
+        data_collector.collect_data(camera_controller, state.session_path, state.speed, state.angle, roi=ROI)
+
+def _record_stopping(state, tick):
+    """
+    Handler for RecordState.STOPPING: save the log and reset for the next session.
+
+    Args:
+        state (State): Current control state.
+        tick (int): Current loop tick.
+
     Returns:
         None
     """
-    global speed, angle, record, done, key_val, key_old
-    if key_val == "RIGHT":
-        speed = speed
-        angle = DEFAULT_ANGLE
-    elif key_val == "LEFT":
-        speed = speed
-        angle = -0.5
-    elif key_val == "UP":
-        speed = DEFAULT_SPEED
-        angle = -0.1
-    elif key_val == "DOWN":
-        speed = -DEFAULT_SPEED
-        angle = -0.1
-    elif key_val == "s":
-        speed = 0
-        angle = 0
-    elif key_val == "k":
-        done += 1
-    elif key_val == key_old:
-        pass
-    elif key_val == "r":
-        key_old = key_val
-        record += 1
-    if key_val != "r":
-        key_val = None
-        key_old = None
+    state.record = RecordState.IDLE
+    data_collector.save_log()
+    data_collector.rotate_log()
+    data_collector.folder_index += 1
+
+# Per-state dispatch table indexed by RecordState; IDLE needs no work.
+_RECORD_HANDLERS = (None, _record_starting, _record_running, _record_stopping)
 
 def main():
     """
@@ -167,48 +261,40 @@ def main():
     Returns:
         None
     """
-    global speed, angle, record, done, key_val, key_old, right_steering_error_handling
+    state = State()
+    period = 1 / LOOP_RATE
+    next_tick = time.monotonic()
+    tick = 0
     while True:
-        angle = 0
-        get_key_press()
-        update_movement_controls()
-
-        motor_controller.move(speed)
-        if right_steering_error_handling == 1:
-            if angle == 0:
-                steering_controller.set_angle(DEFAULT_ANGLE)
-                right_steering_error_handling = 0
-        if angle < 0:
-            right_steering_error_handling = 1
-        steering_controller.set_angle(angle)
-        
-        # Start recording
-        if record == 1:
-            print("Recording Started ...")
-            while os.path.exists(os.path.join(data_collector.data_directory, f"img{str(data_collector.folder_index)}")):
-                data_collector.folder_index += 1
-            new_path = os.path.join(data_collector.data_directory, f"img{str(data_collector.folder_index)}")
-            os.makedirs(new_path)
-            record += 1
-        # Collect data
-        if record == 2:
-            data_collector.collect_data(camera_controller, new_path, speed, angle, roi=ROI)
-        # Save data and reset
-        elif record == 3:
-            record = 0
-            data_collector.save_log()
-            data_collector.img_list.clear()
-            data_collector.speed_list.clear()
-            data_collector.angle_list.clear()
+        state.angle = 0
+        get_key_press(state)
+        update_movement_controls(state)
+
+        apply_correction, correction_angle, state.right_steering_error_handling = \
+            _steering_correction(state.angle, state.right_steering_error_handling)
+        if apply_correction:
+            chassis.set_angle(correction_angle)
+        chassis.apply(state.speed, state.angle)
+
+        # Recording state machine: O(1) table dispatch on the current state
+        record_handler = _RECORD_HANDLERS[state.record]
+        if record_handler is not None:
+            record_handler(state, tick)
 
         # Terminate program
-        if done != 0:
-            motor_controller.stop()
-            motor_controller.release()
-            steering_controller.set_angle(0)
-            steering_controller.detach()
+        if state.done != 0:
+            chassis.release()
             camera_controller.release()
             break
 
+        # Pace the loop to LOOP_RATE with a monotonic deadline
+        tick += 1
+        next_tick += period
+        dt = next_tick - time.monotonic()
+        if dt > 0:
+            time.sleep(dt)
+        else:
+            next_tick = time.monotonic()
+
 if __name__ == "__main__":
     main()
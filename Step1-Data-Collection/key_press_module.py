@@ -2,11 +2,13 @@
 Key Press Module
 =======================
 
-This module provides a simple interface to initialize Pygame and check for key presses.
+This module provides a simple interface to check for key presses by reading the Linux input
+device directly with `evdev` and `epoll`, so it works on a headless Raspberry Pi with no
+display server and no SDL window.
 
 Classes:
 --------
-- KeyPressController: A class to manage Pygame initialization and key press detection.
+- KeyPressController: A class to manage the input device and key press detection.
 
 Example Usage:
 --------------
@@ -15,7 +17,8 @@ To use this module, create an instance of `KeyPressController` and call its meth
     from key_press_module import KeyPressController
 
     key_controller = KeyPressController()
-    key_controller.key_press_init()
+    key_controller.key_press_init(["r"])
+    key_controller.poll()
     if key_controller.get_key_status("r"):
         print("Key 'r' was pressed")
 
@@ -25,94 +28,173 @@ To test this module, you can run it directly as a script. It will check for key
 
 Dependencies:
 -------------
-- pygame: Ensure that the `pygame` library is installed.
+- evdev: Ensure that the `evdev` library is installed and the user can read /dev/input/event*.
 
 Note:
 -----
-This script creates a small window to capture key presses.
+This script reads the keyboard at the kernel evdev level and does not need a window.
 """
 
-import pygame
-from time import sleep
+import select
+
+import evdev
+from evdev import ecodes
 
 class KeyPressController:
     """
-    A class to manage Pygame initialization and key press detection.
+    A class to manage keyboard input device access and key press detection.
 
     Attributes:
     -----------
-    window: Pygame display surface.
+    device_path: Path of the evdev keyboard device to read.
     """
-    def __init__(self):
+    def __init__(self, device_path='/dev/input/event0'):
         """
         Initialize the KeyPressController class.
 
-        Initializes the window attribute to None.
+        Args:
+        device_path (str): Path of the keyboard input device. Default is '/dev/input/event0'.
+        """
+        self.device_path = device_path
+        self._device = None
+        self._epoll = None
+        self._down = set()
+        self._key_codes = {}
+
+    def key_press_init(self, key_names=None):
+        """
+        Open the input device and register it with epoll.
+
+        This method opens the evdev keyboard device in non-blocking mode and precomputes
+        the evdev key codes for the given key names so the hot path avoids per-call lookups.
+
+        Args:
+        key_names (list, optional): Names of the keys that will be queried, used to precompute their key codes.
+
+        Returns:
+        None
+        """
+        self._device = evdev.InputDevice(self.device_path)
+        self._epoll = select.epoll()
+        self._epoll.register(self._device.fileno(), select.EPOLLIN)
+        if key_names:
+            self._key_codes = {name: getattr(ecodes, f'KEY_{name.upper()}') for name in key_names}
+
+    def _drain(self):
+        """
+        Read all pending key events and update the set of currently pressed keys.
+
+        Args:
+        None
+
+        Returns:
+        None
         """
-        self.window = None
+        try:
+            for event in self._device.read():
+                if event.type == ecodes.EV_KEY:
+                    if event.value:  # 1 = press, 2 = autorepeat
+                        self._down.add(event.code)
+                    else:
+                        self._down.discard(event.code)
+        except BlockingIOError:
+            pass
 
-    def key_press_init(self):
+    def poll(self):
         """
-        Initialize Pygame and create a window.
+        Drain pending key events without blocking.
+
+        This method should be called once per loop tick, before querying keys with
+        get_key_status. The cost per tick is one epoll syscall plus one read per
+        key transition, independent of how many keys are being watched.
 
-        This method initializes Pygame and creates a window with a size of 100x100 pixels to capture key presses.
-        
         Args:
         None
-        
+
         Returns:
         None
         """
-        pygame.init()
-        self.window = pygame.display.set_mode((100, 100))
+        if self._epoll.poll(0):
+            self._drain()
+
+    def wait(self, timeout):
+        """
+        Block until a key event arrives or the timeout expires.
+
+        This gives callers an event-driven pacing mechanism instead of a busy loop:
+        the process sleeps in epoll until the kernel reports input. Any events
+        received are folded into the pressed-key set.
+
+        Args:
+        timeout (int): Maximum time to wait in milliseconds.
+
+        Returns:
+        None
+        """
+        if self._epoll.poll(timeout / 1000):
+            self._drain()
 
     def get_key_status(self, key_name):
         """
         Check if a specific key is pressed.
 
-        This method checks if a specific key is currently pressed.
-        
+        This method checks the pressed-key set maintained by poll()/wait().
+
         Args:
         key_name (str): The name of the key to check.
-        
+
         Returns:
         bool: True if the key is pressed, False otherwise.
         """
-        ans = False
-        my_key = getattr(pygame, 'K_{}'.format(key_name))
-        for event in pygame.event.get():
-            pass
-        key_input = pygame.key.get_pressed()
-        ans = key_input[my_key]
-        pygame.display.update()
-        return ans
+        key_code = self._key_codes.get(key_name)
+        if key_code is None:
+            key_code = self._key_codes[key_name] = getattr(ecodes, f'KEY_{key_name.upper()}')
+        return key_code in self._down
+
+    def close(self):
+        """
+        Release the input device and epoll resources.
+
+        Args:
+        None
+
+        Returns:
+        None
+        """
+        if self._epoll is not None:
+            self._epoll.close()
+            self._epoll = None
+        if self._device is not None:
+            self._device.close()
+            self._device = None
 
 def main():
     """
     Main function for module testing.
 
-    This function creates an instance of `KeyPressController`, initializes Pygame, and
+    This function creates an instance of `KeyPressController`, opens the input device, and
     then checks for key presses. If a key is pressed, it prints a message indicating which key was pressed.
-    
+
     This function is intended for testing purposes and should not be used
     when the module is imported elsewhere.
-    
+
     Args:
     None
-    
+
     Returns:
     None
     """
-    key_list = ['r', 'k' 's', 'UP', 'DOWN', 'RIGHT', 'LEFT']
+    key_list = ['r', 'k', 's', 'UP', 'DOWN', 'RIGHT', 'LEFT']
     key_controller = KeyPressController()
-    key_controller.key_press_init()
-    count = 0 
+    key_controller.key_press_init(key_list)
+    count = 0
     while count < 1000:
-        sleep(0.02)
+        key_controller.wait(20)
         for key in key_list:
             if key_controller.get_key_status(key):
                 print(f'Key {key} was pressed')
         count += 1
+    key_controller.close()
 
 if __name__ == '__main__':
     main()
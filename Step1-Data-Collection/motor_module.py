@@ -30,8 +30,14 @@ Note:
 This script is intended to run on a Raspberry Pi with connected DC motors.
 """
 
+import os
+
+# Select the pigpio pin factory before gpiozero is imported: its DMA-timed
+# PWM is jitter-free, unlike the default RPi.GPIO software PWM. Requires the
+# pigpiod daemon to be running.
+os.environ.setdefault('GPIOZERO_PIN_FACTORY', 'pigpio')
+
 from gpiozero   import Motor
-from time       import sleep
 
 class MotorController:
     """
@@ -47,23 +53,31 @@ class MotorController:
             in2: GPIO pin for motor input 2 (IN2).
         """
         self.motor = Motor(forward=in1, backward=in2, enable=ena1)
+        self._last_speed = None
 
     def move(self, speed=0.5):
         """
         Move the motor forward with the specified speed.
 
+        The signed speed is assigned straight to `Motor.value`, which accepts
+        -1..1 directly, so no sign branch or forward/backward method call is
+        needed per tick.
+
         Args:
             speed: Speed of motion, ranging from -1 (full backward) to 1 (full forward). Default is 0.5.
         """
-        speed = max(-1, min(1, speed))
-        if speed < 0:
-            self.motor.backward(-speed)
-        else:
-            self.motor.forward(speed)
+        speed = -1.0 if speed < -1 else (1.0 if speed > 1 else speed)
+        # Skip the gpiozero -> pigpiod round trip when the commanded speed is
+        # effectively unchanged; doubles as a light low-pass on PWM updates.
+        if self._last_speed is not None and abs(speed - self._last_speed) <= 0.01:
+            return
+        self.motor.value = speed
+        self._last_speed = speed
 
     def stop(self):
         """Stop the motor."""
         self.motor.stop()
+        self._last_speed = 0.0
         
     def release(self):
         """Release the GPIO resources used by the motor."""
@@ -85,6 +99,9 @@ def main():
     Returns:
     None
     """
+    # Only the demo loop sleeps, so the import stays out of the module body.
+    from time import sleep
+
     print("Let's introduce our motors to our PI!")
     motor_controller = MotorController(25, 23, 24)
     print("Let's go!")
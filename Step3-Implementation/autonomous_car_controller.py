@@ -47,7 +47,22 @@ This script is designed to control an autonomous car system and requires proper
 import os
 import cv2
 import numpy as np
-from tensorflow.keras.models import load_model
+
+try:
+    # tflite_runtime is the small inference-only wheel shipped to the car.
+    from tflite_runtime.interpreter import Interpreter
+except ImportError:
+    from tensorflow.lite import Interpreter
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional: without it the numeric helpers run as plain Python.
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
 from motor_module import MotorController
 from steering_module import SteeringController
 from picamera_module import PiCameraController
@@ -56,28 +71,116 @@ from picamera_module import PiCameraController
 motor = MotorController(25, 23, 24)
 steering_controller = SteeringController(17)
 
-camera_controller = PiCameraController()
+# A hardware-scaled 640x480 video stream: the ISP does the downscale, so
+# frames arrive two orders of magnitude smaller than full-resolution stills
+# and Python only resizes 640x480 -> 200x66 (or nothing, for fused models).
+camera_controller = PiCameraController(video_size=(640, 480))
 roi = (0.0, 0.2, 0.8, 0.8) #ratio of interest
 camera_controller.pi_cam_init(roi)
 
-model_path = None
-model = load_model(model_path)
+# Quantized TFLite model produced by convert_model_to_tflite.py. The
+# interpreter defaults to one thread; num_threads=4 uses all Pi cores.
+model_path = "model.tflite"
+interpreter = Interpreter(model_path=model_path, num_threads=4)
+interpreter.allocate_tensors()
+# Tensor indices are stable after allocation, so look them up once.
+input_detail = interpreter.get_input_details()[0]
+input_index = input_detail['index']
+output_index = interpreter.get_output_details()[0]['index']
+# Fully int8-quantized models take uint8 pixels and apply their
+# (scale, zero_point) transform inside the interpreter, so the float
+# normalization pass can be skipped entirely.
+quantized_input = input_detail['dtype'] != np.float32
+# Models exported with --fuse-preprocessing take raw frames and run the
+# resize/normalize/color conversion in-graph; detect them by input shape.
+fused_preprocessing = tuple(input_detail['shape'][1:3]) != (66, 200)
+
+# Let the interpreter's thread pool use every core, and raise the process
+# priority when allowed; both calls degrade gracefully where unsupported.
+try:
+    os.sched_setaffinity(0, set(range(os.cpu_count())))
+except (AttributeError, OSError):
+    pass
+try:
+    os.nice(-10)
+except OSError:
+    pass
+
+# Warm up: the first invocations are several times slower while XNNPACK
+# packs weights and the thread pool spins up, so absorb that before the
+# control loop starts instead of on the first real frame.
+_warmup = np.zeros(input_detail['shape'], dtype=input_detail['dtype'])
+for _ in range(3):
+    interpreter.set_tensor(input_index, _warmup)
+    interpreter.invoke()
+del _warmup
+
+# Preprocessing buffers, allocated once and reused every frame via the dst=
+# arguments below. Resizing first means every stage after it runs on the
+# 200x66 model input instead of the full camera frame, so all buffers are
+# fixed-size and the color/blur work shrinks by the frame-to-input area ratio.
+_SMALL_BGR = np.empty((66, 200, 3), np.uint8)
+_YUV_SMALL = np.empty((66, 200, 3), np.uint8)
+_SMALL = np.empty((66, 200, 3), np.uint8)
+_SMALL_BATCH = _SMALL.reshape(1, 66, 200, 3)  # batched view of _SMALL, no copy
+# set_tensor memcpys row-major data; guarantee C-contiguous strides here,
+# once, rather than letting NumPy copy defensively every frame.
+_INP = np.ascontiguousarray(np.empty((1, 66, 200, 3), np.float32))
+# Pre-cast the scale so the multiply runs entirely in float32: a Python
+# float operand would promote the computation through float64.
+_INV_255 = np.float32(1.0 / 255.0)
+# 1-D Gaussian kernel, computed once; applying it separably row- and
+# column-wise halves the memory traffic of the equivalent 2-D convolution.
+_GAUSS_K = cv2.getGaussianKernel(3, 0)
 
 def preProcess(img):
     """
     Preprocess the captured image for the model.
 
+    Every stage writes into a preallocated destination buffer, so the per-frame
+    heap churn (a YUV copy, a blurred copy, a resized copy, and a batched
+    float copy — several MB per tick) is replaced by in-place reuse. The
+    resize runs first, so the color conversion and blur only touch the
+    200x66 output pixels instead of the full frame. The returned tensor is
+    already batched, so callers feed it to the interpreter directly.
+
     Args:
         img (numpy.ndarray): The input image.
 
     Returns:
-        numpy.ndarray: Preprocessed image.
+        numpy.ndarray: Preprocessed float32 tensor of shape (1, 66, 200, 3).
+    """
+    cv2.resize(img, (200, 66), dst=_SMALL_BGR)  # Resize the image
+    # capture_array("main") hands frames to cv2 in BGR order, so convert
+    # straight from BGR and avoid a redundant channel swap.
+    cv2.cvtColor(_SMALL_BGR, cv2.COLOR_BGR2YUV, dst=_YUV_SMALL)  # Convert to YUV color space
+    cv2.sepFilter2D(_YUV_SMALL, -1, _GAUSS_K, _GAUSS_K, dst=_SMALL)  # Apply Gaussian blur
+    if quantized_input:
+        # The interpreter dequantizes uint8 input itself; hand it the
+        # resized pixels without touching them again.
+        return _SMALL_BATCH
+    np.multiply(_SMALL, _INV_255, out=_INP[0], dtype=np.float32)  # Normalize the image
+    return _INP
+
+@njit(fastmath=True, cache=True)
+def _mix(angle, speed):
+    """
+    Pure-numeric per-tick command mixing.
+
+    Clamps the raw model outputs into the actuator command range. Kept free
+    of any object types so it compiles to native code when numba is
+    available; cache=True amortizes the first-call compile across runs.
+
+    Args:
+        angle (float): Raw steering prediction.
+        speed (float): Raw speed prediction.
+
+    Returns:
+        tuple: (speed, angle), both clamped to [-1, 1].
     """
-    img = cv2.cvtColor(img, cv2.COLOR_RGB2YUV)  # Convert to YUV color space
-    img = cv2.GaussianBlur(img, (3, 3), 0)  # Apply Gaussian blur
-    img = cv2.resize(img, (200, 66))  # Resize the image
-    img = img / 255.0  # Normalize the image
-    return img
+    angle = -1.0 if angle < -1.0 else (1.0 if angle > 1.0 else angle)
+    speed = -1.0 if speed < -1.0 else (1.0 if speed > 1.0 else speed)
+    return speed, angle
 
 def main():
     """
@@ -85,21 +188,38 @@ def main():
 
     This function continuously captures images, processes them, and uses a pre-trained model to predict the speed and steering angle to control the car's movement.
     """
-    img_path = os.path.join(os.getcwd(), "road_img")
+    # Hoist the per-tick callables into locals: inside the loop they resolve
+    # with LOAD_FAST instead of a global plus attribute lookup per call.
+    get_latest = camera_controller.get_latest
+    set_tensor = interpreter.set_tensor
+    invoke = interpreter.invoke
+    get_tensor = interpreter.get_tensor
+    move = motor.move
+    set_angle = steering_controller.set_angle
+
+    frame_id = None
     while True:
-        camera_controller.get_img(img_path)  # Capture image
-        img = cv2.imread(img_path)
-        img = np.asarray(img)  # Convert to numpy array
-        img = preProcess(img)  # Preprocess the image
-        img = np.expand_dims(img, axis=0)  # Add batch dimension
-        prediction = model.predict(img)  # Predict angle and speed
-        angle = float(prediction[0][0])  # Extract angle
-        speed = float(prediction[0][1])  # Extract speed
+        # The camera's producer thread keeps capturing while inference runs,
+        # so the two stages overlap; tracking the frame id means each tick
+        # acts on a frame that is both the newest available and never stale.
+        img, frame_id = get_latest(frame_id)
+        if fused_preprocessing:
+            # Preprocessing lives inside the graph; hand over the raw frame.
+            img = img[np.newaxis, ...]
+            if not quantized_input:
+                img = img.astype(np.float32)
+        else:
+            img = preProcess(img)  # Preprocess the image (already batched)
+        set_tensor(input_index, img)
+        invoke()  # Predict angle and speed
+        prediction = get_tensor(output_index)
+        speed, angle = _mix(float(prediction[0][0]), float(prediction[0][1]))
 
         print(f"Angle: {angle}, Speed: {speed}")  # Print values
-        motor.move(speed)  # Control motor
-        steering_controller.set_angle(angle)
-        cv2.waitKey(1)  # Wait for 1 ms
+        move(speed)  # Control motor
+        set_angle(angle)
+        # No waitKey: the loop shows no window, and get_latest already
+        # paces each tick to the arrival of a new camera frame.
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,184 @@
+"""
+TFLite Model Conversion
+=======================
+
+This script converts the trained Keras model into a quantized TFLite model for on-car inference.
+
+Running the full Keras/TensorFlow stack on the Raspberry Pi is several times slower than the
+same network executed by the TFLite interpreter, whose NEON/XNNPACK kernels use int8
+dot-products when the model is quantized. The conversion is done once, off the hot path; the
+autonomous controller then only ships the small .tflite file.
+
+When collected driving images are available they are used as a representative dataset, which
+enables full integer quantization (uint8 input); otherwise the converter falls back to
+dynamic-range quantization, which needs no calibration data.
+
+Functions:
+----------
+- convert_model(model_path, output_path, representative_glob): Convert and quantize the model.
+- main(): Command-line entry point.
+
+Example Usage:
+--------------
+To convert a trained model, pass the Keras model path and the desired output path.
+
+    $ python3 convert_model_to_tflite.py model.h5 model.tflite
+
+Dependencies:
+-------------
+- tensorflow: Required for the conversion step only; it does not need to be installed on the car.
+
+Note:
+-----
+Run this on the training machine, then copy the .tflite file to the Raspberry Pi.
+"""
+
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+import tensorflow as tf
+
+# Default location of the collected driving images used for calibration.
+REPRESENTATIVE_GLOB = 'data_collected/img*/*.jpg'
+# Number of calibration samples; more improves the int8 ranges but slows conversion.
+REPRESENTATIVE_SAMPLES = 200
+# Raw frame size (height, width) baked into fused-preprocessing models;
+# should match the camera stream the controller feeds to the interpreter.
+RAW_INPUT_SIZE = (480, 640)
+
+def _preprocess(img):
+    """
+    Mirror the controller's preprocessing for calibration frames.
+
+    Args:
+        img (numpy.ndarray): BGR image as loaded by cv2.imread.
+
+    Returns:
+        numpy.ndarray: Float32 tensor of shape (1, 66, 200, 3) in [0, 1].
+    """
+    img = cv2.cvtColor(img, cv2.COLOR_BGR2YUV)
+    img = cv2.GaussianBlur(img, (3, 3), 0)
+    img = cv2.resize(img, (200, 66))
+    img = (img / 255.0).astype(np.float32)
+    return img[np.newaxis, ...]
+
+def _representative_dataset(image_paths, fused=False):
+    """
+    Yield calibration batches for full integer quantization.
+
+    Args:
+        image_paths (list): Paths of collected driving images.
+        fused (bool): Whether the model expects raw frames (fused preprocessing).
+
+    Returns:
+        generator: Yields single-image batches in the model's input format.
+    """
+    height, width = RAW_INPUT_SIZE
+    for path in image_paths[:REPRESENTATIVE_SAMPLES]:
+        img = cv2.imread(str(path))
+        if img is None:
+            continue
+        if fused:
+            raw = cv2.resize(img, (width, height)).astype(np.float32)
+            yield [raw[np.newaxis, ...]]
+        else:
+            yield [_preprocess(img)]
+
+def _build_fused_model(base_model):
+    """
+    Wrap the trained model with in-graph preprocessing layers.
+
+    The resize, normalization, and color conversion run inside the TFLite
+    graph, where XNNPACK executes them with the same NEON kernels as the
+    model and fuses them with the first convolution's input tile. The BGR to
+    YUV conversion is expressed as a fixed 1x1 convolution (BT.601 matrix);
+    the Gaussian blur is deliberately left out, since the first conv layer
+    filters noise itself.
+
+    Args:
+        base_model (tf.keras.Model): The trained steering/speed model.
+
+    Returns:
+        tf.keras.Model: Model taking raw RAW_INPUT_SIZE BGR frames.
+    """
+    height, width = RAW_INPUT_SIZE
+    inputs = tf.keras.Input(shape=(height, width, 3))
+    x = tf.keras.layers.Resizing(66, 200)(inputs)
+    x = tf.keras.layers.Rescaling(1.0 / 255.0)(x)
+    # BGR -> YUV (BT.601) as a constant 1x1 conv: kernel[0,0,i,o] is the
+    # weight of input channel i (B, G, R) for output channel o (Y, U, V).
+    yuv_matrix = np.array([[0.114, 0.587, 0.299],
+                           [0.436, -0.28886, -0.14713],
+                           [-0.10001, -0.51499, 0.615]], dtype=np.float32)
+    yuv_bias = np.array([0.0, 0.5, 0.5], dtype=np.float32)
+    yuv_layer = tf.keras.layers.Conv2D(3, 1, trainable=False)
+    x = yuv_layer(x)
+    yuv_layer.set_weights([yuv_matrix.T.reshape(1, 1, 3, 3), yuv_bias])
+    outputs = base_model(x)
+    return tf.keras.Model(inputs, outputs)
+
+def convert_model(model_path, output_path, representative_glob=REPRESENTATIVE_GLOB,
+                  fuse_preprocessing=False):
+    """
+    Convert a trained Keras model to a quantized TFLite model.
+
+    With calibration images available the model is fully int8-quantized and
+    takes uint8 input, so the interpreter applies the (scale, zero_point)
+    transform internally and the controller can skip float normalization.
+    Without them, dynamic-range quantization still shrinks the weights to
+    int8 while keeping the float input interface.
+
+    Args:
+        model_path (str): Path of the trained Keras model (.h5 or SavedModel).
+        output_path (str): Path to write the .tflite model to.
+        representative_glob (str): Glob for calibration images, relative to the working directory.
+        fuse_preprocessing (bool): Bake resize/normalize/color conversion into the graph.
+
+    Returns:
+        None
+    """
+    model = tf.keras.models.load_model(model_path)
+    if fuse_preprocessing:
+        print(f"Fusing preprocessing into the graph (raw input {RAW_INPUT_SIZE})")
+        model = _build_fused_model(model)
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+
+    image_paths = sorted(Path().glob(representative_glob))
+    if image_paths:
+        print(f"Calibrating full int8 quantization on {min(len(image_paths), REPRESENTATIVE_SAMPLES)} images")
+        converter.representative_dataset = lambda: _representative_dataset(image_paths, fused=fuse_preprocessing)
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.uint8
+    else:
+        print("No collected images found; using dynamic-range quantization")
+
+    tflite_model = converter.convert()
+    Path(output_path).write_bytes(tflite_model)
+    print(f"Wrote {output_path} ({len(tflite_model) / 1024:.0f} KiB)")
+
+def main():
+    """
+    Main function for command-line conversion.
+
+    Reads the model and output paths from the command line, falling back to
+    'model.h5' and 'model.tflite' in the working directory. Passing
+    --fuse-preprocessing bakes the resize/normalize/color-conversion stages
+    into the exported graph.
+
+    Args:
+    None
+
+    Returns:
+    None
+    """
+    args = [arg for arg in sys.argv[1:] if arg != '--fuse-preprocessing']
+    fuse_preprocessing = '--fuse-preprocessing' in sys.argv[1:]
+    model_path = args[0] if len(args) > 0 else 'model.h5'
+    output_path = args[1] if len(args) > 1 else 'model.tflite'
+    convert_model(model_path, output_path, fuse_preprocessing=fuse_preprocessing)
+
+if __name__ == '__main__':
+    main()
@@ -30,8 +30,15 @@ Note:
 This script is intended to run on a Raspberry Pi with a connected servo motor.
 """
 
+import os
+
+# Select the pigpio pin factory before gpiozero is imported: its DMA-timed
+# PWM is jitter-free, unlike the default RPi.GPIO software PWM. Requires the
+# pigpiod daemon to be running.
+os.environ.setdefault('GPIOZERO_PIN_FACTORY', 'pigpio')
+
 from gpiozero import AngularServo
-from time import sleep
+from time import monotonic, sleep
 
 class SteeringController:
     """
@@ -45,6 +52,7 @@ class SteeringController:
             pin: GPIO pin for the servo signal. Default is 17.
         """
         self.servo = AngularServo(pin, min_angle = min, max_angle = max)
+        self._last_ratio = None
 
     def set_angle(self, ratio):
         """
@@ -53,12 +61,18 @@ class SteeringController:
         Args:
             ratio: Ratio for the angle, ranging from -1 (minimum position) to 1 (maximum position).
         """
-        ratio = max(-1, min(1, ratio))
+        ratio = -1.0 if ratio < -1 else (1.0 if ratio > 1 else ratio)
+        # Skip the gpiozero -> pigpiod round trip when the commanded angle is
+        # effectively unchanged; doubles as a light low-pass on servo updates.
+        if self._last_ratio is not None and abs(ratio - self._last_ratio) <= 0.01:
+            return
         self.servo.angle = int(ratio * 90)
+        self._last_ratio = ratio
 
     def detach(self):
         """Release the GPIO resources used by the servo."""
         self.servo.detach()
+        self._last_ratio = None
 
 def main():
     """
@@ -78,29 +92,41 @@ def main():
     """
     print("Let's introduce our steering servo motor to our PI!")
     steering_controller = SteeringController(17)
+    # Deadline-based pacing: each step's deadline advances by a fixed period
+    # from the previous one, so the sweep cadence cannot drift the way
+    # back-to-back sleep(2) calls do under CPU load.
+    next_t = monotonic()
+
+    def pace(period=2.0):
+        nonlocal next_t
+        next_t += period
+        delay = next_t - monotonic()
+        if delay > 0:
+            sleep(delay)
+
     print("Let's go!")
     try:
         while True:
             # Set angle to maximum (1.0)
             print("Setting angle to maximum (1.0)")
             steering_controller.set_angle(0.1)
-            sleep(2)
+            pace()
 
             # Set angle to middle (0.0)
             print("Setting angle to middle (0.0)")
             steering_controller.set_angle(0.0)
-            sleep(2)
+            pace()
 
             # Set angle to minimum (-1.0)
             print("Setting angle to minimum (-1.0)")
             steering_controller.set_angle(-0.1)
-            sleep(2)
+            pace()
 
             # Sweep back and forth
             print("Sweeping back and forth")
             for ratio in [-0.1, 0, 0.1, 0]:
                 steering_controller.set_angle(ratio)
-                sleep(2)
+                pace()
             
     except KeyboardInterrupt:
         steering_controller.detach()